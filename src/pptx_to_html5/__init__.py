@@ -1,8 +1,22 @@
 """PowerPoint to HTML5 conversion tools."""
 
 from importlib.metadata import version as get_version
+from typing import TYPE_CHECKING, Any
 
-from pptx_to_html5.converter import PowerPointToHTML5Converter
+if TYPE_CHECKING:
+    from pptx_to_html5.converter import PowerPointToHTML5Converter
 
 __version__ = get_version(__package__)
 __all__ = ["PowerPointToHTML5Converter"]
+
+
+def __getattr__(name: str) -> Any:
+    # The converter defers python-pptx and Jinja2 itself, but still imports
+    # MarkupSafe and the multiprocessing machinery of concurrent.futures,
+    # which adds about half again to the cost of importing the package; load it
+    # on first access so importing the package (and the CLI) stays cheap
+    if name == "PowerPointToHTML5Converter":
+        from pptx_to_html5.converter import PowerPointToHTML5Converter
+
+        return PowerPointToHTML5Converter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
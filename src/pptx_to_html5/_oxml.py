@@ -0,0 +1,106 @@
+"""Readers for the slide XML parsed by python-pptx.
+
+python-pptx's element properties compile an XPath expression on every
+access; these helpers walk the underlying lxml elements with queries compiled
+once. The module imports python-pptx and lxml, so the converter only loads it
+once there is a slide to read.
+"""
+
+from collections.abc import Callable
+from typing import Any, cast
+
+from lxml import etree
+from pptx.oxml.ns import namespaces, qn
+from pptx.oxml.text import CT_RegularTextRun, CT_TextParagraph
+from pptx.text.text import Font
+from pptx.util import Emu, Length
+
+# Names of paragraph alignments, keyed by their pptx.enum.text.PP_ALIGN value;
+# paragraphs without an explicit alignment are left-aligned
+_ALIGNMENT_NAMES: dict[int | None, str] = {
+    None: "LEFT",
+    1: "LEFT",
+    2: "CENTER",
+    3: "RIGHT",
+    4: "JUSTIFY",
+    5: "DISTRIBUTE",
+    6: "THAI_DISTRIBUTE",
+    7: "JUSTIFY_LOW",
+    -2: "MIXED",
+}
+
+_NAMESPACES = namespaces("a", "p")
+_LINE_BREAK_TAG = qn("a:br")
+
+_XP_PARAGRAPH_TEXT = cast(
+    "Callable[[Any], list[Any]]",
+    etree.XPath("./a:r/a:t | ./a:fld/a:t | ./a:br", namespaces=_NAMESPACES),
+)
+_XP_FIRST_RUN = cast(
+    "Callable[[Any], list[CT_RegularTextRun]]",
+    etree.XPath("./a:r[1]", namespaces=_NAMESPACES),
+)
+
+# The <a:p> paragraphs of a shape's own text body
+paragraphs_of = cast(
+    "Callable[[Any], list[CT_TextParagraph]]",
+    etree.XPath("./p:txBody/a:p", namespaces=_NAMESPACES),
+)
+
+# Whether a slide element defines timing (animations)
+HAS_TIMING = cast(
+    "Callable[[Any], bool]",
+    etree.XPath("boolean(.//p:timing)", namespaces=_NAMESPACES),
+)
+
+
+def as_emu(length: Length | None) -> Emu | None:
+    """Normalize a python-pptx length to a plain EMU value.
+
+    Subclasses such as ``Centipoints`` rescale their constructor argument, so
+    they come back wrong when slide content is pickled between processes.
+    """
+    return None if length is None else Emu(length)
+
+
+def first_run_font(paragraph: CT_TextParagraph) -> dict[str, Any]:
+    """Read the font formatting of a paragraph's first run.
+
+    Args:
+        paragraph: The ``<a:p>`` element to read
+
+    Returns:
+        Font size, name, bold and italic flags, or an empty dictionary when
+        the paragraph has no runs
+    """
+    runs = _XP_FIRST_RUN(paragraph)
+    if not runs:
+        return {}
+    r_pr = runs[0].rPr
+    if r_pr is None:
+        return {"font_size": None, "font_name": None, "bold": None, "italic": None}
+    font = Font(r_pr)
+    return {
+        "font_size": as_emu(font.size),
+        "font_name": font.name,
+        "bold": font.bold,
+        "italic": font.italic,
+    }
+
+
+def paragraph_text(paragraph: CT_TextParagraph) -> str:
+    """Join the text of a paragraph's runs, fields and line breaks.
+
+    Matches python-pptx's paragraph text, with line breaks as vertical tabs.
+    """
+    return "".join(
+        "\v" if element.tag == _LINE_BREAK_TAG else (element.text or "")
+        for element in _XP_PARAGRAPH_TEXT(paragraph)
+    )
+
+
+def alignment_name(paragraph: CT_TextParagraph) -> str:
+    """Describe a paragraph's horizontal alignment, defaulting to left."""
+    p_pr = paragraph.pPr
+    alignment = p_pr.algn if p_pr is not None else None
+    return _ALIGNMENT_NAMES.get(alignment, "LEFT")
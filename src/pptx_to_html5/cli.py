@@ -4,8 +4,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from pptx_to_html5.converter import PowerPointToHTML5Converter
-
 
 def main() -> int:
     """Main entry point for the CLI.
@@ -21,6 +19,7 @@ Examples:
   pptx-to-html presentation.pptx
   pptx-to-html presentation.pptx -o output_folder
   pptx-to-html presentation.pptx --include-notes
+  pptx-to-html presentation.pptx --workers 4
         """,
     )
 
@@ -45,6 +44,14 @@ Examples:
         help="Include speaker notes in the output",
     )
 
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to extract slides with (default: 1)",
+    )
+
     parser.add_argument(
         "-v",
         "--version",
@@ -62,9 +69,15 @@ Examples:
         output_dir = input_path.parent / input_path.stem
 
     try:
+        # Imported here so --help and --version don't load the converter's
+        # MarkupSafe and multiprocessing imports
+        from pptx_to_html5.converter import PowerPointToHTML5Converter
+
         # Create converter and convert
         converter = PowerPointToHTML5Converter(args.input)
-        output_file = converter.convert(output_dir, include_notes=args.include_notes)
+        output_file = converter.convert(
+            output_dir, include_notes=args.include_notes, workers=args.workers
+        )
 
         print("✓ Successfully converted presentation to HTML5")
         print(f"✓ Output: {output_file}")
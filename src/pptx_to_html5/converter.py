@@ -1,15 +1,306 @@
 """Core PowerPoint to HTML5 converter."""
 
-import base64
+import binascii
+import hashlib
 import io
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+import zlib
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
+
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+    from pptx.shapes.base import BaseShape
+    from pptx.slide import Slide
+    from pptx.util import Length
+
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+# Templates ship with the package and never change at runtime, so a single
+# environment (and its compiled-template cache) is shared by every converter.
+# Slide text is untrusted input, so HTML templates are autoescaped, and block
+# tags are trimmed so control flow doesn't leave blank lines in the output.
+_AUTOESCAPE_EXTENSIONS = ("html",)
+_TEMPLATE_OPTIONS: dict[str, Any] = {
+    "auto_reload": False,
+    "cache_size": -1,
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+}
+
+
+@cache
+def _environment() -> "Environment":
+    """Build the template environment on first use.
+
+    Jinja2 is imported here rather than at module level so that importing
+    the converter stays cheap.
+    """
+    import jinja2
+    from jinja2 import (
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        select_autoescape,
+    )
+
+    # Cached bytecode is keyed only on the template source, so the cache file
+    # names carry a digest of everything else that changes the compiled code
+    options_key = repr(
+        (jinja2.__version__, _AUTOESCAPE_EXTENSIONS, sorted(_TEMPLATE_OPTIONS.items()))
+    )
+    options_digest = hashlib.sha1(options_key.encode(), usedforsecurity=False)
+    return Environment(
+        loader=FileSystemLoader(_TEMPLATES_DIR),
+        autoescape=select_autoescape(_AUTOESCAPE_EXTENSIONS),
+        **_TEMPLATE_OPTIONS,
+        # Without a directory, Jinja2 uses a per-user cache directory
+        bytecode_cache=FileSystemBytecodeCache(
+            pattern=f"__pptx_to_html5_{options_digest.hexdigest()[:16]}_%s.cache"
+        ),
+    )
+
+
+# Common PowerPoint special character mappings, applied in a single pass
+# via str.translate
+_PPT_SPECIAL_CHARS = str.maketrans(
+    {
+        "\uf0e0": "→",  # Right arrow
+        "\uf0d8": "←",  # Left arrow
+        "\uf0d9": "↑",  # Up arrow
+        "\uf0da": "↓",  # Down arrow
+        "\uf0a7": "•",  # Bullet point (alternative)
+        "\uf0b7": "•",  # Bullet point
+        "\uf0fc": "✓",  # Check mark
+        "\uf0fb": "✗",  # Cross mark
+    }
+)
+
+
+# Decks with fewer slides than this are extracted in-process even when worker
+# processes are requested; below it, the cost of starting workers (each
+# re-opening the .pptx) outweighs the gain.
+_PARALLEL_MIN_SLIDES = 4
+
+
+# Signature that starts every PNG file
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Image formats keyed by the signature their files start with; WebP is
+# recognised by a second marker further in, and anything else is embedded
+# as PNG
+_IMAGE_SIGNATURES = (
+    (_PNG_SIGNATURE, b"png"),
+    (b"\xff\xd8\xff", b"jpeg"),
+    (b"GIF8", b"gif"),
+    (b"BM", b"bmp"),
+)
+
+# Signature of a ZIP local file header, which every .pptx starts with
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+@cache
+def _read_template(template_path: Path) -> str:
+    """Read a static template file, caching its contents for the process."""
+    return template_path.read_text(encoding="utf-8")
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Frame PNG chunk data with its length and CRC."""
+    crc = zlib.crc32(chunk_type + data)
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+@cache
+def _blank_png_data_uri(
+    width: int, height: int, color: tuple[int, int, int] = (255, 255, 255)
+) -> str:
+    """Encode a solid-colour PNG of the given size as a data URI.
+
+    The placeholder is identical for every slide, so it is encoded once per
+    size and colour and reused.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        color: RGB fill colour, white by default
+
+    Returns:
+        PNG data URI
+    """
+    # A solid colour needs no image library: every scanline is the same
+    # unfiltered row of pixels, which zlib compresses to almost nothing
+    scanline = b"\x00" + bytes(color) * width
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    png = b"".join(
+        (
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            _png_chunk(b"IDAT", zlib.compress(scanline * height)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+    img_str = binascii.b2a_base64(png, newline=False).decode("ascii")
+    return f"data:image/png;base64,{img_str}"
+
+
+def _image_format(image_bytes: bytes) -> bytes:
+    """Detect the format of an image blob from its file signature."""
+    for signature, image_format in _IMAGE_SIGNATURES:
+        if image_bytes.startswith(signature):
+            return image_format
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return b"webp"
+    return b"png"
+
+
+def _image_data_uri(image_bytes: bytes) -> Markup:
+    """Encode an image blob as a base64 data URI.
+
+    Args:
+        image_bytes: Raw bytes of the embedded image
+
+    Returns:
+        Data URI with the image format detected from the blob's signature,
+        marked safe since base64 output never needs HTML escaping
+    """
+    # Detect image format from content
+    img_format = _image_format(image_bytes)
+    # The data URI is pure ASCII, so build it as bytes and decode the
+    # finished URI once
+    data_uri = b"".join(
+        (
+            b"data:image/",
+            img_format,
+            b";base64,",
+            binascii.b2a_base64(image_bytes, newline=False),
+        )
+    )
+    return Markup(data_uri.decode("ascii"))
+
+
+def _css_box(
+    shape: "BaseShape",
+    slide_width: "Length | None",
+    slide_height: "Length | None",
+) -> Markup:
+    """Build the percentage-based CSS position and size of a shape.
+
+    Args:
+        shape: The shape to position
+        slide_width: Width of the slide in EMU
+        slide_height: Height of the slide in EMU
+
+    Returns:
+        CSS declarations for ``left``, ``top``, ``width`` and ``height``, or
+        an empty string if the slide size or the shape's own position or size
+        is unknown; marked safe as it only contains numbers and fixed property
+        names
+    """
+    if not slide_width or not slide_height:
+        return Markup()
+    # Shapes without an <a:xfrm> (and not inheriting one) have no geometry
+    left, top, width, height = shape.left, shape.top, shape.width, shape.height
+    if left is None or top is None or width is None or height is None:
+        return Markup()
+    return Markup(
+        f"left: {round(left / slide_width * 100, 2)}%; "
+        f"top: {round(top / slide_height * 100, 2)}%; "
+        f"width: {round(width / slide_width * 100, 2)}%; "
+        f"height: {round(height / slide_height * 100, 2)}%;"
+    )
+
+
+def _css_text_align(alignment: str) -> str:
+    """Map a PowerPoint alignment name to a CSS ``text-align`` value."""
+    if "CENTER" in alignment:
+        return "center"
+    if "RIGHT" in alignment:
+        return "right"
+    return "left"
+
+
+def _copy_static_asset(source: Path, destination: Path) -> None:
+    """Copy a packaged template file into the output directory.
+
+    The copy is given the source's modification time, so an output left in
+    place by an earlier conversion is recognised by its size and mtime and is
+    not rewritten.
+
+    Args:
+        source: Template file to copy
+        destination: Path of the copy in the output directory
+    """
+    source_stat = source.stat()
+    try:
+        destination_stat = destination.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            destination_stat.st_size == source_stat.st_size
+            and destination_stat.st_mtime_ns == source_stat.st_mtime_ns
+        ):
+            return
+
+    shutil.copyfile(source, destination)
+    os.utime(destination, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
+
+def _check_package(package: IO[bytes]) -> None:
+    """Cheaply reject files that cannot be an Open XML package.
+
+    Only the file signature and the ZIP central directory are read, so bogus
+    files fail before python-pptx parses anything.
+
+    Args:
+        package: Binary file positioned at the start of the package; it is
+            rewound before returning
+
+    Raises:
+        ValueError: If the file is not a ZIP archive with a content types part
+    """
+    if package.read(4) != _ZIP_MAGIC:
+        raise ValueError("not a ZIP archive")
+    with zipfile.ZipFile(package) as archive:
+        try:
+            archive.getinfo("[Content_Types].xml")
+        except KeyError:
+            raise ValueError("missing [Content_Types].xml") from None
+    package.seek(0)
+
+
+@dataclass(slots=True, frozen=True)
+class SlideData:
+    """A slide as handed to the presentation template.
 
-from jinja2 import Template
-from PIL import Image
-from pptx import Presentation
-from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.slide import Slide
+    Attributes:
+        number: 1-based position of the slide in the deck
+        title: Text of the shape identified as the slide title
+        shapes: Positioned shape dictionaries, in z-order
+        notes: Speaker notes, empty unless notes were requested
+        hidden: Whether the slide is hidden in the original presentation
+    """
+
+    number: int
+    title: str
+    shapes: list[dict[str, Any]]
+    notes: str
+    hidden: bool
 
 
 class PowerPointToHTML5Converter:
@@ -31,13 +322,71 @@ class PowerPointToHTML5Converter:
         if not self.pptx_path.suffix.lower() == ".pptx":
             raise ValueError(f"File must be a .pptx file: {pptx_path}")
 
+        # What worker processes re-open the presentation from
+        self._source: str | bytes = str(self.pptx_path)
+        self._open(self._source)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, name: str = "presentation"
+    ) -> "PowerPointToHTML5Converter":
+        """Create a converter for a presentation that is already in memory.
+
+        No file is read, so a deck that was downloaded or read once can be
+        handed to several converters without touching the disk again. The
+        converter's ``pptx_path`` is set to ``<name>.pptx``, which need not
+        exist.
+
+        Args:
+            data: Contents of a .pptx file
+            name: Name of the presentation, used as the page title
+
+        Returns:
+            Converter for the in-memory presentation
+
+        Raises:
+            ValueError: If the data is not a valid PowerPoint file
+        """
+        converter = cls.__new__(cls)
+        converter.pptx_path = Path(f"{name}.pptx")
+        converter._source = data
+        converter._open(io.BytesIO(data))
+        return converter
+
+    def _open(self, package: str | IO[bytes]) -> None:
+        """Parse the presentation and read its deck-wide properties.
+
+        Args:
+            package: Path to the PowerPoint file, or its contents as a binary
+                file positioned at the start
+
+        Raises:
+            ValueError: If the package is not a valid PowerPoint file
+        """
         try:
-            self.presentation = Presentation(str(self.pptx_path))
+            if isinstance(package, str):
+                with open(package, "rb") as f:
+                    _check_package(f)
+            else:
+                _check_package(package)
+            from pptx import Presentation
+
+            self.presentation = Presentation(package)
         except Exception as e:
             raise ValueError(f"Invalid PowerPoint file: {e}") from e
 
+        # Slide size is shared by every slide, so read it once
+        self._slide_width = self.presentation.slide_width
+        self._slide_height = self.presentation.slide_height
+
+        # Text shapes starting in the top quarter of a slide are title candidates
+        self._title_top_threshold = (self._slide_height or 0) / 4
+
         # Get path to templates directory
-        self.templates_dir = Path(__file__).parent / "templates"
+        self.templates_dir = _TEMPLATES_DIR
+
+        # Data URIs of embedded images, keyed by the SHA1 of the image blob
+        self._image_uri_cache: dict[str, Markup] = {}
 
     def _replace_ppt_special_chars(self, text: str) -> str:
         """Replace PowerPoint special characters with HTML-friendly equivalents.
@@ -51,24 +400,11 @@ class PowerPointToHTML5Converter:
         Returns:
             Text with special characters replaced
         """
-        # Common PowerPoint special character mappings
-        replacements = {
-            "\uf0e0": "→",  # Right arrow
-            "\uf0d8": "←",  # Left arrow
-            "\uf0d9": "↑",  # Up arrow
-            "\uf0da": "↓",  # Down arrow
-            "\uf0a7": "•",  # Bullet point (alternative)
-            "\uf0b7": "•",  # Bullet point
-            "\uf0fc": "✓",  # Check mark
-            "\uf0fb": "✗",  # Cross mark
-        }
-
-        for ppt_char, replacement in replacements.items():
-            text = text.replace(ppt_char, replacement)
+        if not text:
+            return text
+        return text.translate(_PPT_SPECIAL_CHARS)
 
-        return text
-
-    def _slide_to_image(self, slide: Slide, slide_number: int) -> str:
+    def _slide_to_image(self, slide: "Slide", slide_number: int) -> str:
         """Convert a slide to a base64-encoded PNG image.
 
         Args:
@@ -78,19 +414,12 @@ class PowerPointToHTML5Converter:
         Returns:
             Base64-encoded PNG image as a data URI
         """
-        # Create an image from the slide
         # Since python-pptx doesn't provide direct rendering, we'll export metadata
         # and use a placeholder approach. For production, you'd use a library like
         # aspose.slides or convert via LibreOffice/unoconv
-        img = Image.new("RGB", (1280, 720), color=(255, 255, 255))
-
-        # Convert to base64
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        img_str = base64.b64encode(buffer.getvalue()).decode()
-        return f"data:image/png;base64,{img_str}"
+        return _blank_png_data_uri(1280, 720)
 
-    def _is_slide_hidden(self, slide: Slide) -> bool:
+    def _is_slide_hidden(self, slide: "Slide") -> bool:
         """Determine whether a slide is marked as hidden in the .pptx.
 
         Tries a few heuristics against the underlying XML element since
@@ -118,21 +447,33 @@ class PowerPointToHTML5Converter:
             return False
 
         return False
-    def _extract_slide_content(self, slide: Slide) -> dict[str, Any]:
+    def _extract_slide_content(
+        self, slide: "Slide", *, include_notes: bool = False
+    ) -> dict[str, Any]:
         """Extract text and content from a slide with positioning.
 
         Args:
             slide: The slide to extract content from
+            include_notes: Whether to read the slide's speaker notes; when
+                False the notes slide is never parsed and notes stay empty
 
         Returns:
             Dictionary containing slide content with positioned shapes
         """
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+        from pptx_to_html5._oxml import (
+            HAS_TIMING,
+            alignment_name,
+            first_run_font,
+            paragraph_text,
+            paragraphs_of,
+        )
+
         content: dict[str, Any] = {
             "title": "",
             "shapes": [],
             "notes": "",
-            "slide_width": self.presentation.slide_width,
-            "slide_height": self.presentation.slide_height,
             "hidden": False,
         }
 
@@ -143,11 +484,20 @@ class PowerPointToHTML5Converter:
             content["hidden"] = False
 
         # Extract shapes with positioning
+        slide_width = self._slide_width
+        slide_height = self._slide_height
+        title_top_threshold = self._title_top_threshold
+        replace_special_chars = self._replace_ppt_special_chars
+        image_uri_cache = self._image_uri_cache
+        append_shape = content["shapes"].append
+        # Without a slide height there is no top quarter to find a title in
+        title_pending = bool(title_top_threshold)
         for idx, shape in enumerate(slide.shapes):
+            top = shape.top
             shape_data: dict[str, Any] = {
                 "type": "unknown",
                 "left": shape.left,
-                "top": shape.top,
+                "top": top,
                 "width": shape.width,
                 "height": shape.height,
             }
@@ -161,108 +511,98 @@ class PowerPointToHTML5Converter:
                 shape_name = f"shape-{idx+1}"
             shape_data["name"] = shape_name
 
-            # Extract text shapes
-            if hasattr(shape, "text") and shape.text:
-                text = self._replace_ppt_special_chars(shape.text.strip())
+            # Extract text shapes, reading paragraphs straight from the
+            # shape's parsed <p:txBody> rather than through python-pptx's
+            # per-paragraph and per-run proxy objects
+            para_elements = paragraphs_of(shape._element)
+            para_texts = [paragraph_text(p) for p in para_elements]
+            shape_text = "\n".join(para_texts)
+            if shape_text:
+                text = replace_special_chars(shape_text.strip())
                 if text:
                     shape_data["type"] = "text"
 
                     # Extract paragraphs to preserve bullet points and formatting
                     paragraphs = []
-                    if hasattr(shape, "text_frame"):
-                        text_frame = shape.text_frame
-                        for para in text_frame.paragraphs:
-                            para_text = self._replace_ppt_special_chars(para.text.strip())
-                            if para_text:
-                                para_data = {
-                                    "text": para_text,
-                                    "level": para.level if hasattr(para, "level") else 0,
-                                    "alignment": str(para.alignment) if para.alignment else "LEFT",
-                                }
-
-                                # Get font formatting from first run
-                                if para.runs:
-                                    run = para.runs[0]
-                                    if hasattr(run, "font"):
-                                        font = run.font
-                                        para_data["font_size"] = font.size
-                                        para_data["font_name"] = font.name
-                                        para_data["bold"] = font.bold
-                                        para_data["italic"] = font.italic
-
-                                paragraphs.append(para_data)
-
-                        shape_data["paragraphs"] = paragraphs
-
-                        # Store simple text for backward compatibility
-                        shape_data["text"] = text
-
-                        # Get formatting from first paragraph for overall shape
-                        if text_frame.paragraphs:
-                            para = text_frame.paragraphs[0]
-                            if para.runs:
-                                run = para.runs[0]
-                                if hasattr(run, "font"):
-                                    font = run.font
-                                    shape_data["font_size"] = font.size
-                                    shape_data["font_name"] = font.name
-                                    shape_data["bold"] = font.bold
-                                    shape_data["italic"] = font.italic
-
-                            # Check alignment
-                            shape_data["alignment"] = str(para.alignment) if para.alignment else "LEFT"
-                    else:
-                        # Fallback if no text_frame
-                        shape_data["text"] = text
-                        shape_data["paragraphs"] = [{"text": text, "level": 0}]
+                    for p, raw_text in zip(para_elements, para_texts, strict=True):
+                        para_text = replace_special_chars(raw_text.strip())
+                        if para_text:
+                            p_pr = p.pPr
+                            alignment = alignment_name(p)
+                            para_data = {
+                                "text": para_text,
+                                "level": p_pr.lvl if p_pr is not None else 0,
+                                "alignment": alignment,
+                                "text_align": _css_text_align(alignment),
+                            }
+
+                            # Get font formatting from first run
+                            para_data.update(first_run_font(p))
+                            paragraphs.append(para_data)
+
+                    shape_data["paragraphs"] = paragraphs
+
+                    # Store simple text for backward compatibility
+                    shape_data["text"] = text
+
+                    # Get formatting from first paragraph for overall shape
+                    first_para = para_elements[0]
+                    shape_data.update(first_run_font(first_para))
+                    shape_data["alignment"] = alignment_name(first_para)
+                    shape_data["text_align"] = _css_text_align(shape_data["alignment"])
 
                     # Identify title shapes (typically at top and larger)
-                    slide_height = self.presentation.slide_height
                     if (
-                        not content["title"]
-                        and slide_height is not None
-                        and shape.top < slide_height / 4
+                        title_pending
+                        and top is not None
+                        and top < title_top_threshold
                     ):
                         content["title"] = text
+                        title_pending = False
                         shape_data["is_title"] = True
                     else:
                         shape_data["is_title"] = False
 
-                    content["shapes"].append(shape_data)
+                    shape_data["box"] = _css_box(shape, slide_width, slide_height)
+                    append_shape(shape_data)
 
             # Extract autoshapes (arrows, rectangles, etc.)
             elif shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
                 shape_data["type"] = "autoshape"
-                if hasattr(shape, "auto_shape_type"):
-                    try:
-                        shape_data["autoshape_type"] = str(shape.auto_shape_type)
-                        shape_data["autoshape_type_value"] = shape.auto_shape_type.value if hasattr(shape.auto_shape_type, 'value') else 0
-                    except Exception:
-                        shape_data["autoshape_type"] = "UNKNOWN"
-                        shape_data["autoshape_type_value"] = 0
-                content["shapes"].append(shape_data)
+                try:
+                    auto_shape_type = getattr(shape, "auto_shape_type", None)
+                    if auto_shape_type is not None:
+                        shape_data["autoshape_type"] = str(auto_shape_type)
+                        shape_data["autoshape_type_value"] = getattr(
+                            auto_shape_type, "value", 0
+                        )
+                except Exception:
+                    shape_data["autoshape_type"] = "UNKNOWN"
+                    shape_data["autoshape_type_value"] = 0
+                shape_data["box"] = _css_box(shape, slide_width, slide_height)
+                append_shape(shape_data)
 
             # Extract picture shapes - check multiple ways
-            elif hasattr(shape, "image") or shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            elif (image := getattr(shape, "image", None)) is not None or (
+                shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+            ):
                 shape_data["type"] = "picture"
-                if hasattr(shape, "image"):
+                if image is not None:
                     try:
-                        image_bytes = shape.image.blob
-                        img_base64 = base64.b64encode(image_bytes).decode()
-                        # Detect image format from content
-                        if image_bytes[:4] == b'\x89PNG':
-                            img_format = "png"
-                        elif image_bytes[:2] == b'\xff\xd8':
-                            img_format = "jpeg"
-                        else:
-                            img_format = "png"  # default
-                        shape_data["image_data"] = f"data:image/{img_format};base64,{img_base64}"
+                        # Logos and backgrounds repeat across slides; encode
+                        # each distinct image only once
+                        data_uri = image_uri_cache.get(image.sha1)
+                        if data_uri is None:
+                            data_uri = _image_data_uri(image.blob)
+                            image_uri_cache[image.sha1] = data_uri
+                        shape_data["image_data"] = data_uri
                     except Exception:
                         pass
-                content["shapes"].append(shape_data)
+                shape_data["box"] = _css_box(shape, slide_width, slide_height)
+                append_shape(shape_data)
 
         # Extract speaker notes
-        if slide.has_notes_slide:
+        if include_notes and slide.has_notes_slide:
             notes_slide = slide.notes_slide
             if notes_slide.notes_text_frame:
                 content["notes"] = notes_slide.notes_text_frame.text.strip()
@@ -273,9 +613,7 @@ class PowerPointToHTML5Converter:
         # a simple staggered 'appear' animation for each shape so the output
         # visually preserves that the slide had animated content.
         try:
-            ns = {"p": "http://schemas.openxmlformats.org/presentationml/2006/main"}
-            timing = slide._element.find('.//p:timing', ns)
-            has_timing = timing is not None
+            has_timing = HAS_TIMING(slide._element)
         except Exception:
             has_timing = False
 
@@ -288,14 +626,115 @@ class PowerPointToHTML5Converter:
 
         return content
 
+    def _extract_all_slides(
+        self, *, include_notes: bool = False, workers: int = 1
+    ) -> list[dict[str, Any]]:
+        """Extract the content of every slide, in presentation order.
+
+        Args:
+            include_notes: Whether to extract speaker notes
+            workers: Number of worker processes to extract slides with
+
+        Returns:
+            List of slide content dictionaries, one per slide
+        """
+        return list(
+            self._iter_slide_contents(include_notes=include_notes, workers=workers)
+        )
+
+    def _iter_slide_contents(
+        self, *, include_notes: bool = False, workers: int = 1
+    ) -> Generator[dict[str, Any], None, None]:
+        """Iterate over the content of every slide, in presentation order.
+
+        Slides are independent of each other, so when more than one worker is
+        requested, decks of at least ``_PARALLEL_MIN_SLIDES`` slides are
+        spread across a pool of worker processes, each opening its own copy
+        of the presentation. Images repeated across slides are then encoded
+        once per worker rather than once per converter.
+
+        Every slide is submitted before this returns, so the worker processes
+        are started on the calling thread rather than on whichever thread
+        consumes the slides. If the pool cannot be started, or breaks while
+        slides are extracted, the remaining slides are extracted in-process.
+
+        Args:
+            include_notes: Whether to extract speaker notes
+            workers: Number of worker processes to extract slides with; the
+                default of one extracts every slide in-process
+
+        Returns:
+            Generator of slide content dictionaries, one per slide
+        """
+        slide_count = len(self.presentation.slides)
+        workers = min(workers, slide_count)
+        if workers < 2 or slide_count < _PARALLEL_MIN_SLIDES:
+            return self._iter_slide_contents_serial(0, include_notes=include_notes)
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._source,),
+        )
+        extract = partial(_extract_slide_at, include_notes=include_notes)
+        # Hand out slides in batches to cut per-task IPC round trips, while
+        # leaving a few batches per worker to balance uneven slides
+        chunksize = max(1, slide_count // (workers * 4))
+        try:
+            results = executor.map(extract, range(slide_count), chunksize=chunksize)
+        except (BrokenProcessPool, OSError, AssertionError):
+            # multiprocessing asserts that daemonic processes have no children
+            executor.shutdown(cancel_futures=True)
+            return self._iter_slide_contents_serial(0, include_notes=include_notes)
+        return self._iter_slide_contents_pooled(
+            executor, results, include_notes=include_notes
+        )
+
+    def _iter_slide_contents_serial(
+        self, start: int, *, include_notes: bool
+    ) -> Generator[dict[str, Any], None, None]:
+        """Extract slides in-process, beginning with the one at ``start``."""
+        for slide in islice(self.presentation.slides, start, None):
+            yield self._extract_slide_content(slide, include_notes=include_notes)
+
+    def _iter_slide_contents_pooled(
+        self,
+        executor: ProcessPoolExecutor,
+        results: Iterator[dict[str, Any]],
+        *,
+        include_notes: bool,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield slides as the worker pool returns them, then shut it down.
+
+        Slides the pool didn't return before it broke are extracted
+        in-process.
+        """
+        extracted = 0
+        try:
+            for content in results:
+                yield content
+                extracted += 1
+        except (BrokenProcessPool, OSError):
+            pass
+        finally:
+            executor.shutdown(cancel_futures=True)
+        yield from self._iter_slide_contents_serial(
+            extracted, include_notes=include_notes
+        )
+
     def convert(
-        self, output_dir: str | Path, include_notes: bool = False
+        self,
+        output_dir: str | Path,
+        include_notes: bool = False,
+        workers: int = 1,
     ) -> Path:
         """Convert the PowerPoint presentation to an HTML5 website.
 
         Args:
             output_dir: Directory where the HTML5 website will be created
             include_notes: Whether to include speaker notes in the output
+            workers: Number of worker processes to extract slides with; the
+                default of one extracts every slide in-process
 
         Returns:
             Path to the generated index.html file
@@ -306,60 +745,135 @@ class PowerPointToHTML5Converter:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Extract slides
-        slides_data = []
-        for i, slide in enumerate(self.presentation.slides):
-            slide_content = self._extract_slide_content(slide)
-            slide_data = {
-                "number": i + 1,
-                "title": slide_content["title"],
-                "shapes": slide_content["shapes"],
-                "notes": slide_content["notes"] if include_notes else "",
-                "slide_width": slide_content["slide_width"],
-                "slide_height": slide_content["slide_height"],
-                "hidden": slide_content.get("hidden", False),
-            }
-            slides_data.append(slide_data)
+        # Extract slides lazily, so each one can be rendered and released
+        # before the next is built
+        slides_content = self._iter_slide_contents(
+            include_notes=include_notes, workers=workers
+        )
+        slides_data = (
+            SlideData(
+                number=i + 1,
+                title=slide_content["title"],
+                shapes=slide_content["shapes"],
+                notes=slide_content["notes"],
+                hidden=slide_content.get("hidden", False),
+            )
+            for i, slide_content in enumerate(slides_content)
+        )
+        slide_count = len(self.presentation.slides)
 
-        # Generate HTML
-        html_content = self._generate_html(slides_data, include_notes)
         html_path = output_path / "index.html"
-        html_path.write_text(html_content, encoding="utf-8")
-
-        # Generate CSS
-        css_content = self._generate_css()
-        css_path = output_path / "styles.css"
-        css_path.write_text(css_content, encoding="utf-8")
 
-        # Generate JavaScript
-        js_content = self._generate_js()
-        js_path = output_path / "script.js"
-        js_path.write_text(js_content, encoding="utf-8")
+        # Stream the HTML to disk while the static CSS and JavaScript are copied
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                writes: list[Future[Any]] = [
+                    executor.submit(
+                        self._write_html,
+                        html_path,
+                        slides_data,
+                        slide_count,
+                        include_notes,
+                    ),
+                    executor.submit(
+                        _copy_static_asset,
+                        self.templates_dir / "styles.css",
+                        output_path / "styles.css",
+                    ),
+                    executor.submit(
+                        _copy_static_asset,
+                        self.templates_dir / "script.js",
+                        output_path / "script.js",
+                    ),
+                ]
+                for write in writes:
+                    write.result()
+        finally:
+            # Shut down any extraction workers left running by a failed write
+            slides_content.close()
 
         return html_path
 
     def _generate_html(
-        self, slides_data: list[dict[str, Any]], include_notes: bool
+        self, slides_data: Sequence[SlideData], include_notes: bool
     ) -> str:
         """Generate HTML content for the presentation.
 
         Args:
-            slides_data: List of slide data dictionaries
+            slides_data: Slides to render, in order
             include_notes: Whether to include speaker notes
 
         Returns:
             HTML content as a string
         """
-        template_path = self.templates_dir / "presentation.html"
-        template_content = template_path.read_text(encoding="utf-8")
-        template = Template(template_content)
-
-        # Use the original PowerPoint filename (without extension) as the title
-        title = self.pptx_path.stem
+        template = _environment().get_template("presentation.html")
+        context = self._template_context(slides_data, len(slides_data), include_notes)
+        return template.render(context)
+
+    def _write_html(
+        self,
+        html_path: Path,
+        slides_data: Iterable[SlideData],
+        slide_count: int,
+        include_notes: bool,
+    ) -> None:
+        """Render the presentation HTML straight into a file.
+
+        Rendered chunks are written as the template produces them, so the
+        full document (often dominated by base64 images) is never held in
+        memory as a single string. They go to a temporary file next to
+        ``html_path`` that replaces it only once rendering succeeds, so a
+        failed render leaves any earlier output in place.
 
-        return template.render(
-            title=title, slides=slides_data, include_notes=include_notes
-        )
+        Args:
+            html_path: File to write the HTML to
+            slides_data: Slides to render, consumed once in order
+            slide_count: Number of slides in slides_data
+            include_notes: Whether to include speaker notes
+        """
+        template = _environment().get_template("presentation.html")
+        context = self._template_context(slides_data, slide_count, include_notes)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            buffering=1 << 20,
+            dir=html_path.parent,
+            prefix=f".{html_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_path = Path(f.name)
+            try:
+                f.writelines(template.generate(context))
+            except BaseException:
+                f.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        try:
+            # Temporary files are created private to the owner; give the page
+            # the permissions a regular file write would
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, html_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _template_context(
+        self,
+        slides_data: Iterable[SlideData],
+        slide_count: int,
+        include_notes: bool,
+    ) -> dict[str, Any]:
+        """Collect the variables the presentation template renders with."""
+        return {
+            # Use the original PowerPoint filename (without extension) as the title
+            "title": self.pptx_path.stem,
+            "slides": slides_data,
+            "slide_count": slide_count,
+            "include_notes": include_notes,
+            "presentation_width": self._slide_width,
+            "presentation_height": self._slide_height,
+        }
 
     def _generate_css(self) -> str:
         """Generate CSS styles for the presentation.
@@ -367,8 +881,7 @@ class PowerPointToHTML5Converter:
         Returns:
             CSS content as a string
         """
-        css_path = self.templates_dir / "styles.css"
-        return css_path.read_text(encoding="utf-8")
+        return _read_template(self.templates_dir / "styles.css")
 
     def _generate_js(self) -> str:
         """Generate JavaScript for slide navigation and interactivity.
@@ -376,5 +889,26 @@ class PowerPointToHTML5Converter:
         Returns:
             JavaScript content as a string
         """
-        js_path = self.templates_dir / "script.js"
-        return js_path.read_text(encoding="utf-8")
+        return _read_template(self.templates_dir / "script.js")
+
+
+# Converter owned by each worker process of the slide extraction pool
+_worker_converter: PowerPointToHTML5Converter | None = None
+
+
+def _init_worker(source: str | bytes) -> None:
+    """Open the presentation once per worker process."""
+    global _worker_converter
+    if isinstance(source, bytes):
+        _worker_converter = PowerPointToHTML5Converter.from_bytes(source)
+    else:
+        _worker_converter = PowerPointToHTML5Converter(source)
+
+
+def _extract_slide_at(slide_index: int, *, include_notes: bool) -> dict[str, Any]:
+    """Extract the content of a single slide inside a worker process."""
+    assert _worker_converter is not None
+    slide = _worker_converter.presentation.slides[slide_index]
+    return _worker_converter._extract_slide_content(
+        slide, include_notes=include_notes
+    )
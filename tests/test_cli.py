@@ -2,8 +2,6 @@
 
 import subprocess
 import sys
-import tempfile
-from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
@@ -14,9 +12,12 @@ from pptx.util import Inches
 from pptx_to_html5.cli import main
 
 
-@pytest.fixture
-def sample_pptx() -> Iterator[Path]:
-    """Create a sample PowerPoint presentation for testing.
+@pytest.fixture(scope="session")
+def sample_pptx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample PowerPoint presentation shared by the whole session.
+
+    Tests must not modify the file. The default output directory is created
+    next to it, inside pytest's temporary directory.
 
     Returns:
         Path to the temporary PowerPoint file
@@ -30,17 +31,11 @@ def sample_pptx() -> Iterator[Path]:
     prs.slide_width = Inches(10)
     prs.slide_height = Inches(7.5)
 
-    with tempfile.NamedTemporaryFile(
-        suffix=".pptx", delete=False
-    ) as tmp_file:
-        tmp_path = Path(tmp_file.name)
-        prs.save(tmp_file.name)
-
-    yield tmp_path
+    # Save to a temporary file that pytest removes with its base directory
+    tmp_path = tmp_path_factory.mktemp("cli") / "sample.pptx"
+    prs.save(str(tmp_path))
 
-    # Cleanup
-    if tmp_path.exists():
-        tmp_path.unlink()
+    return tmp_path
 
 
 class TestCLI:
@@ -97,6 +92,22 @@ class TestCLI:
         assert exit_code == 0
         assert (output_dir / "index.html").exists()
 
+    def test_main_with_workers(
+        self, sample_pptx: Path, tmp_path: Path
+    ) -> None:
+        """Test CLI with --workers."""
+        output_dir = tmp_path / "output"
+
+        with patch.object(
+            sys,
+            "argv",
+            ["pptx-to-html", str(sample_pptx), "-o", str(output_dir), "-w", "2"],
+        ):
+            exit_code = main()
+
+        assert exit_code == 0
+        assert (output_dir / "index.html").exists()
+
     def test_main_default_output(
         self, sample_pptx: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
@@ -145,3 +156,25 @@ class TestCLI:
 
         assert result.returncode == 0
         assert "0.1.0" in result.stdout
+
+    def test_help_does_not_load_converter(self) -> None:
+        """Test that parsing arguments doesn't import the conversion stack."""
+        script = (
+            "import sys\n"
+            "from pptx_to_html5.cli import main\n"
+            "sys.argv = ['pptx-to-html', '--help']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = {'pptx', 'jinja2', 'PIL', 'pptx_to_html5.converter'}\n"
+            "print(sorted(loaded & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip().endswith("[]")
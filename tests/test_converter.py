@@ -1,19 +1,79 @@
 """Test suite for PowerPoint to HTML5 converter."""
 
-import tempfile
-from collections.abc import Iterator
+import base64
+import io
+import re
+import subprocess
+import sys
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Any
 
 import pytest
+from markupsafe import Markup
+from PIL import Image
 from pptx import Presentation
-from pptx.util import Inches
+from pptx.enum.shapes import MSO_CONNECTOR
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt
 
-from pptx_to_html5.converter import PowerPointToHTML5Converter
+from pptx_to_html5 import converter as converter_module
+from pptx_to_html5.converter import PowerPointToHTML5Converter, SlideData
 
+_SLIDE_TITLE = re.compile(r"Slide ([1-5])\b")
 
-@pytest.fixture
-def sample_pptx() -> Iterator[Path]:
-    """Create a sample PowerPoint presentation for testing.
+
+class _FailingPool:
+    """Stand-in for ProcessPoolExecutor whose worker pool fails.
+
+    Without a converter, submitting slides raises the error; with one, the
+    first ``returned`` slides are extracted before the error is raised while
+    results are collected.
+    """
+
+    def __init__(
+        self,
+        error: BaseException,
+        converter: PowerPointToHTML5Converter | None = None,
+        returned: int = 0,
+    ) -> None:
+        self.error = error
+        self.converter = converter
+        self.returned = returned
+        self.created = False
+        self.shut_down = False
+
+    def __call__(self, **kwargs: Any) -> "_FailingPool":
+        self.created = True
+        return self
+
+    def map(
+        self, fn: Any, indices: Iterable[int], chunksize: int = 1
+    ) -> Iterator[dict[str, Any]]:
+        if self.converter is None:
+            raise self.error
+        return self._results(list(indices))
+
+    def _results(self, indices: list[int]) -> Iterator[dict[str, Any]]:
+        assert self.converter is not None
+        slides = self.converter.presentation.slides
+        for index in indices[: self.returned]:
+            yield self.converter._extract_slide_content(slides[index])
+        raise self.error
+
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        self.shut_down = True
+
+
+@pytest.fixture(scope="session")
+def sample_pptx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample PowerPoint presentation shared by the whole session.
+
+    Tests must treat the file as read-only. Under pytest-xdist each worker
+    builds its own copy in its own base temporary directory.
 
     Returns:
         Path to the temporary PowerPoint file
@@ -40,34 +100,78 @@ def sample_pptx() -> Iterator[Path]:
     tf = body_shape.text_frame
     tf.text = "First bullet point"
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(
-        suffix=".pptx", delete=False
-    ) as tmp_file:
-        tmp_path = Path(tmp_file.name)
-        prs.save(tmp_file.name)
+    # Save to a temporary file that pytest removes with its base directory
+    tmp_path = tmp_path_factory.mktemp("pptx") / "sample.pptx"
+    prs.save(str(tmp_path))
+
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def multi_slide_pptx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a five-slide presentation shared by the whole session.
+
+    Returns:
+        Path to the temporary PowerPoint file
+    """
+    prs = Presentation()
+    for i in range(5):
+        slide_layout = prs.slide_layouts[0]
+        slide = prs.slides.add_slide(slide_layout)
+        title = slide.shapes.title
+        title.text = f"Slide {i + 1}"
+
+    pptx_path = tmp_path_factory.mktemp("multi") / "multi_slide.pptx"
+    prs.save(str(pptx_path))
+
+    return pptx_path
 
-    yield tmp_path
 
-    # Cleanup
-    if tmp_path.exists():
-        tmp_path.unlink()
+@pytest.fixture(scope="module")
+def converter(sample_pptx: Path) -> PowerPointToHTML5Converter:
+    """Open the sample presentation once for the tests that only read it.
 
+    Returns:
+        Converter for the sample presentation
+    """
+    return PowerPointToHTML5Converter(sample_pptx)
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["notes", "no-notes"])
+def converted(
+    request: pytest.FixtureRequest,
+    converter: PowerPointToHTML5Converter,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[bool, Path]:
+    """Convert the sample presentation once with and once without notes.
 
-@pytest.fixture
-def output_dir() -> Iterator[Path]:
-    """Create a temporary output directory.
+    Tests must treat the output as read-only.
 
     Returns:
-        Path to the temporary directory
+        Whether notes were included, and the path to the generated HTML file
     """
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
+    include_notes: bool = request.param
+    output_dir = tmp_path_factory.mktemp("converted")
+    return include_notes, converter.convert(output_dir, include_notes=include_notes)
 
 
 class TestPowerPointToHTML5Converter:
     """Test cases for PowerPointToHTML5Converter class."""
 
+    def test_import_is_lazy(self) -> None:
+        """Test that importing the converter defers python-pptx and Jinja2."""
+        script = (
+            "import sys\n"
+            "import pptx_to_html5.converter\n"
+            "print(sorted({'pptx', 'jinja2', 'lxml'} & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "[]"
+
     def test_init_valid_file(self, sample_pptx: Path) -> None:
         """Test initialization with a valid PowerPoint file."""
         converter = PowerPointToHTML5Converter(sample_pptx)
@@ -86,60 +190,302 @@ class TestPowerPointToHTML5Converter:
         with pytest.raises(ValueError, match="must be a .pptx file"):
             PowerPointToHTML5Converter(invalid_file)
 
-    def test_init_invalid_pptx(self, tmp_path: Path) -> None:
-        """Test initialization with an invalid PowerPoint file."""
+    @pytest.mark.parametrize(
+        "content",
+        [b"not a valid pptx file", b"", b"PK\x05\x06" + bytes(18)],
+        ids=["text", "empty", "empty-zip"],
+    )
+    def test_init_invalid_pptx(self, tmp_path: Path, content: bytes) -> None:
+        """Test that files without a ZIP signature fail the signature check."""
         invalid_pptx = tmp_path / "invalid.pptx"
-        invalid_pptx.write_text("not a valid pptx file")
-        with pytest.raises(ValueError, match="Invalid PowerPoint file"):
+        invalid_pptx.write_bytes(content)
+        with pytest.raises(ValueError, match="Invalid PowerPoint file: not a ZIP"):
             PowerPointToHTML5Converter(invalid_pptx)
 
-    def test_extract_slide_content(self, sample_pptx: Path) -> None:
+    def test_init_zip_without_content_types(self, tmp_path: Path) -> None:
+        """Test that a ZIP archive that isn't an Open XML package is rejected."""
+        not_pptx = tmp_path / "archive.pptx"
+        with zipfile.ZipFile(not_pptx, "w") as archive:
+            archive.writestr("readme.txt", "hello")
+        with pytest.raises(ValueError, match=r"Invalid PowerPoint file: missing"):
+            PowerPointToHTML5Converter(not_pptx)
+
+    def test_from_bytes(self, sample_pptx: Path, tmp_path: Path) -> None:
+        """Test converting a presentation that is already in memory."""
+        from_path = PowerPointToHTML5Converter(sample_pptx)
+        converter = PowerPointToHTML5Converter.from_bytes(
+            sample_pptx.read_bytes(), name="In Memory"
+        )
+
+        assert converter._extract_all_slides() == from_path._extract_all_slides()
+        html = converter.convert(tmp_path).read_text(encoding="utf-8")
+        assert "<title>In Memory</title>" in html
+
+    def test_from_bytes_parallel(self, tmp_path: Path) -> None:
+        """Test that worker processes can open an in-memory presentation."""
+        prs = Presentation()
+        for i in range(5):
+            prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = f"S{i}"
+        buffer = io.BytesIO()
+        prs.save(buffer)
+
+        converter = PowerPointToHTML5Converter.from_bytes(buffer.getvalue())
+        contents = converter._extract_all_slides(workers=2)
+        assert [content["title"] for content in contents] == [f"S{i}" for i in range(5)]
+
+    def test_from_bytes_invalid(self) -> None:
+        """Test that in-memory data that isn't a package is rejected."""
+        with pytest.raises(ValueError, match="Invalid PowerPoint file"):
+            PowerPointToHTML5Converter.from_bytes(b"not a valid pptx file")
+
+    def test_extract_slide_content(self, converter: PowerPointToHTML5Converter) -> None:
         """Test extracting content from a slide."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
-        slides = list(converter.presentation.slides)
+        slides = converter.presentation.slides
         assert len(slides) >= 1
 
         content = converter._extract_slide_content(slides[0])
         assert isinstance(content, dict)
-        assert "title" in content
-        assert "shapes" in content
-        assert "notes" in content
-        assert "slide_width" in content
-        assert "slide_height" in content
+        assert {"title", "shapes", "notes", "hidden"} <= content.keys()
         # Check that shapes were extracted
         assert len(content["shapes"]) > 0
         # Verify at least one shape contains the expected text
-        shape_texts = [s.get("text", "") for s in content["shapes"]]
-        assert "Test Presentation" in shape_texts
+        assert any(s.get("text") == "Test Presentation" for s in content["shapes"])
+
+    def test_extract_notes_only_when_requested(self, tmp_path: Path) -> None:
+        """Test that speaker notes are read only when asked for."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.notes_slide.notes_text_frame.text = "Remember the demo"
+
+        pptx_path = tmp_path / "notes.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        slide = converter.presentation.slides[0]
+
+        assert converter._extract_slide_content(slide)["notes"] == ""
+        content = converter._extract_slide_content(slide, include_notes=True)
+        assert content["notes"] == "Remember the demo"
+
+    def test_replace_ppt_special_chars(
+        self, converter: PowerPointToHTML5Converter
+    ) -> None:
+        """Test that PowerPoint private-use symbols are mapped to Unicode."""
+        assert converter._replace_ppt_special_chars("\uf0b7 Go \uf0e0") == "• Go →"
+        assert converter._replace_ppt_special_chars("plain text") == "plain text"
+        assert converter._replace_ppt_special_chars("") == ""
+
+    def test_extract_text_with_line_break(self, tmp_path: Path) -> None:
+        """Test that paragraph text matches python-pptx across line breaks."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        text_frame = slide.shapes.add_textbox(
+            Inches(1), Inches(4), Inches(4), Inches(1)
+        ).text_frame
+        text_frame.text = "First line\vSecond line"
+
+        pptx_path = tmp_path / "line_break.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        slide = converter.presentation.slides[0]
+        content = converter._extract_slide_content(slide)
+
+        (paragraph,) = content["shapes"][0]["paragraphs"]
+        assert paragraph["text"] == slide.shapes[0].text_frame.paragraphs[0].text
+        assert paragraph["text"] == "First line\vSecond line"
+
+    def test_convert_without_slide_size(self, tmp_path: Path) -> None:
+        """Test converting a deck that doesn't declare a slide size."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+        textbox.text_frame.text = "No slide size"
+        prs._element.remove(prs._element.sldSz)
+
+        pptx_path = tmp_path / "no_size.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        assert converter.presentation.slide_width is None
+
+        html = converter.convert(tmp_path / "out").read_text(encoding="utf-8")
+        assert "No slide size" in html
+        assert "padding-bottom" not in html
+
+    def test_extract_paragraph_alignment(self, tmp_path: Path) -> None:
+        """Test that paragraph alignment is extracted and rendered as CSS."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        text_frame = slide.shapes.add_textbox(
+            Inches(1), Inches(4), Inches(4), Inches(1)
+        ).text_frame
+        text_frame.text = "Centered"
+        text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        right = text_frame.add_paragraph()
+        right.text = "Right-aligned"
+        right.alignment = PP_ALIGN.RIGHT
+
+        pptx_path = tmp_path / "alignment.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        content = converter._extract_slide_content(converter.presentation.slides[0])
+
+        (shape,) = content["shapes"]
+        assert shape["alignment"] == "CENTER"
+        assert shape["text_align"] == "center"
+        assert [(p["alignment"], p["text_align"]) for p in shape["paragraphs"]] == [
+            ("CENTER", "center"),
+            ("RIGHT", "right"),
+        ]
+
+        html = converter.convert(tmp_path / "out").read_text(encoding="utf-8")
+        assert html.count("text-align: center;") == 2
+        assert html.count("text-align: right;") == 1
+
+    def test_convert_shapes_without_xfrm(self, tmp_path: Path) -> None:
+        """Test that shapes with no position or size don't break conversion."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        connector = slide.shapes.add_connector(
+            MSO_CONNECTOR.STRAIGHT, Inches(1), Inches(1), Inches(2), Inches(2)
+        )
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(4), Inches(1))
+        textbox.text_frame.text = "Floating text"
+        for shape in (connector, textbox):
+            sp_pr = shape._element.spPr
+            sp_pr.remove(sp_pr.find(qn("a:xfrm")))
+
+        pptx_path = tmp_path / "no_xfrm.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        content = converter._extract_slide_content(converter.presentation.slides[0])
+        (text_shape,) = content["shapes"]
+        assert text_shape["text"] == "Floating text"
+        assert text_shape["box"] == ""
+        assert text_shape["is_title"] is False
+
+        html_path = converter.convert(tmp_path / "out")
+        assert "Floating text" in html_path.read_text(encoding="utf-8")
+
+    def test_extract_picture_shapes(self, tmp_path: Path) -> None:
+        """Test that pictures are embedded as data URIs of the right format."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        for image_format in ("PNG", "JPEG", "GIF"):
+            buffer = io.BytesIO()
+            Image.new("RGB", (8, 8), color=(255, 0, 0)).save(buffer, image_format)
+            buffer.seek(0)
+            slide.shapes.add_picture(buffer, Inches(1), Inches(1))
+
+        pptx_path = tmp_path / "pictures.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        content = converter._extract_slide_content(converter.presentation.slides[0])
+
+        png, jpeg, gif = (s for s in content["shapes"] if s["type"] == "picture")
+        assert png["image_data"].startswith("data:image/png;base64,iVBORw0KGgo")
+        assert jpeg["image_data"].startswith("data:image/jpeg;base64,/9j/")
+        assert gif["image_data"].startswith("data:image/gif;base64,R0lGOD")
+        # Data URIs are pre-marked safe so rendering skips escaping them
+        assert isinstance(png["image_data"], Markup)
+
+    @pytest.mark.parametrize(
+        ("blob", "mime_type"),
+        [
+            (b"BM" + bytes(12), "image/bmp"),
+            (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+            (b"Bogus data", "image/png"),
+            (b"RIFF\x24\x00\x00\x00WAVEfmt ", "image/png"),
+            (b"", "image/png"),
+        ],
+        ids=["bmp", "webp", "b-prefix", "riff-wave", "empty"],
+    )
+    def test_image_data_uri_format(self, blob: bytes, mime_type: str) -> None:
+        """Test that image formats are detected from their full signature."""
+        data_uri = converter_module._image_data_uri(blob)
+
+        assert data_uri.startswith(f"data:{mime_type};base64,")
+        assert base64.b64decode(data_uri.split(",", 1)[1]) == blob
+
+    def test_extract_repeated_picture_encoded_once(self, tmp_path: Path) -> None:
+        """Test that an image repeated across slides shares one data URI."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8), color=(0, 0, 255)).save(buffer, "PNG")
+        prs = Presentation()
+        for _ in range(2):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            buffer.seek(0)
+            slide.shapes.add_picture(buffer, Inches(1), Inches(1))
+
+        pptx_path = tmp_path / "logo.pptx"
+        prs.save(str(pptx_path))
 
-    def test_slide_to_image(self, sample_pptx: Path) -> None:
+        converter = PowerPointToHTML5Converter(pptx_path)
+        first, second = (
+            converter._extract_slide_content(slide)["shapes"][0]["image_data"]
+            for slide in converter.presentation.slides
+        )
+        assert first is second
+        assert len(converter._image_uri_cache) == 1
+
+    def test_slide_to_image(self, converter: PowerPointToHTML5Converter) -> None:
         """Test converting a slide to an image."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
-        slides = list(converter.presentation.slides)
-        image_data = converter._slide_to_image(slides[0], 0)
+        image_data = converter._slide_to_image(converter.presentation.slides[0], 0)
 
         assert isinstance(image_data, str)
         assert image_data.startswith("data:image/png;base64,")
         assert len(image_data) > 100  # Should have substantial content
 
-    def test_convert_creates_files(
-        self, sample_pptx: Path, output_dir: Path
-    ) -> None:
+    def test_blank_png_data_uri_cached_per_variant(self) -> None:
+        """Test that placeholder images are encoded once per size and colour."""
+        white = converter_module._blank_png_data_uri(16, 9)
+        assert converter_module._blank_png_data_uri(16, 9) is white
+        assert converter_module._blank_png_data_uri(16, 9, (0, 0, 0)) != white
+        assert converter_module._blank_png_data_uri(32, 18) != white
+
+    def test_blank_png_data_uri_decodes(self) -> None:
+        """Test that the hand-built placeholder is a valid solid-colour PNG."""
+        data_uri = converter_module._blank_png_data_uri(40, 30, (10, 20, 30))
+        assert data_uri.startswith("data:image/png;base64,")
+
+        png = base64.b64decode(data_uri.split(",", 1)[1])
+        with Image.open(io.BytesIO(png)) as img:
+            assert img.format == "PNG"
+            assert img.size == (40, 30)
+            assert img.mode == "RGB"
+            assert img.getcolors() == [(40 * 30, (10, 20, 30))]
+
+    def test_convert_creates_files(self, converted: tuple[bool, Path]) -> None:
         """Test that convert creates all necessary files."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
-        html_path = converter.convert(output_dir)
+        _, html_path = converted
 
         assert html_path.exists()
         assert html_path.name == "index.html"
-        assert (output_dir / "styles.css").exists()
-        assert (output_dir / "script.js").exists()
+        assert (html_path.parent / "styles.css").exists()
+        assert (html_path.parent / "script.js").exists()
 
-    def test_convert_html_content(
-        self, sample_pptx: Path, output_dir: Path
+    def test_convert_refreshes_static_assets(
+        self, converter: PowerPointToHTML5Converter, tmp_path: Path
     ) -> None:
+        """Test that stale CSS/JS in the output directory are replaced."""
+        (tmp_path / "styles.css").write_text("stale", encoding="utf-8")
+        converter.convert(tmp_path)
+        converter.convert(tmp_path)
+
+        assert (tmp_path / "styles.css").read_text(
+            encoding="utf-8"
+        ) == converter._generate_css()
+        assert (tmp_path / "script.js").read_text(
+            encoding="utf-8"
+        ) == converter._generate_js()
+
+    def test_convert_html_content(self, converted: tuple[bool, Path]) -> None:
         """Test that the generated HTML contains expected content."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
-        html_path = converter.convert(output_dir)
+        _, html_path = converted
 
         html_content = html_path.read_text(encoding="utf-8")
         assert "<!DOCTYPE html>" in html_content
@@ -148,29 +494,87 @@ class TestPowerPointToHTML5Converter:
         assert "styles.css" in html_content
         assert "script.js" in html_content
 
-    def test_convert_with_notes(
-        self, sample_pptx: Path, output_dir: Path
+    def test_write_html_matches_generate_html(
+        self, converter: PowerPointToHTML5Converter, tmp_path: Path
     ) -> None:
-        """Test conversion with speaker notes included."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
-        html_path = converter.convert(output_dir, include_notes=True)
+        """Test that streaming the HTML to disk renders the same document."""
+        html_path = converter.convert(tmp_path, include_notes=True)
+
+        slides_data = [
+            SlideData(number=i + 1, **content)
+            for i, content in enumerate(
+                converter._extract_all_slides(include_notes=True)
+            )
+        ]
+        assert html_path.read_text(encoding="utf-8") == converter._generate_html(
+            slides_data, include_notes=True
+        )
+
+    def test_write_html_removes_partial_file(
+        self, converter: PowerPointToHTML5Converter, tmp_path: Path
+    ) -> None:
+        """Test that a failed render doesn't leave a truncated index.html."""
 
-        html_content = html_path.read_text(encoding="utf-8")
-        assert html_content is not None
+        def failing_slides() -> Iterator[SlideData]:
+            yield SlideData(number=1, title="", shapes=[], notes="", hidden=False)
+            raise RuntimeError("extraction failed")
 
-    def test_convert_without_notes(
-        self, sample_pptx: Path, output_dir: Path
-    ) -> None:
-        """Test conversion without speaker notes."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
-        html_path = converter.convert(output_dir, include_notes=False)
+        html_path = tmp_path / "index.html"
+        with pytest.raises(RuntimeError, match="extraction failed"):
+            converter._write_html(html_path, failing_slides(), 2, include_notes=False)
 
-        html_content = html_path.read_text(encoding="utf-8")
-        assert "speaker notes" not in html_content.lower()
+        assert not html_path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+        # Output from an earlier conversion survives a failed re-render
+        html_path.write_text("previous output", encoding="utf-8")
+        with pytest.raises(RuntimeError, match="extraction failed"):
+            converter._write_html(html_path, failing_slides(), 2, include_notes=False)
+
+        assert html_path.read_text(encoding="utf-8") == "previous output"
+        assert list(tmp_path.iterdir()) == [html_path]
+
+    def test_convert_escapes_slide_text(self, tmp_path: Path) -> None:
+        """Test that markup typed into a slide is rendered as text."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[0])
+        slide.shapes.title.text = "<script>alert('x')</script> & more"
+
+        pptx_path = tmp_path / "markup.pptx"
+        prs.save(str(pptx_path))
+
+        converter = PowerPointToHTML5Converter(pptx_path)
+        html_content = converter.convert(tmp_path / "out").read_text(encoding="utf-8")
+
+        assert "<script>alert" not in html_content
+        assert "&lt;script&gt;alert(&#39;x&#39;)&lt;/script&gt; &amp; more" in (
+            html_content
+        )
+
+    def test_convert_notes(self, converted: tuple[bool, Path]) -> None:
+        """Test conversion with and without speaker notes."""
+        include_notes, html_path = converted
+
+        assert html_path.stat().st_size > 0
+        if not include_notes:
+            html_content = html_path.read_text(encoding="utf-8")
+            assert "speaker notes" not in html_content.lower()
 
-    def test_generate_css(self, sample_pptx: Path) -> None:
+    def test_bytecode_cache_keyed_on_template_options(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changing template options stops reusing cached bytecode."""
+        pattern = converter_module._environment().bytecode_cache.pattern
+        changed = {**converter_module._TEMPLATE_OPTIONS, "trim_blocks": False}
+        monkeypatch.setattr(converter_module, "_TEMPLATE_OPTIONS", changed)
+        converter_module._environment.cache_clear()
+        try:
+            assert converter_module._environment().bytecode_cache.pattern != pattern
+        finally:
+            converter_module._environment.cache_clear()
+
+    def test_generate_css(self, converter: PowerPointToHTML5Converter) -> None:
         """Test CSS generation."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
         css = converter._generate_css()
 
         assert isinstance(css, str)
@@ -179,9 +583,8 @@ class TestPowerPointToHTML5Converter:
         assert ".nav-btn" in css
         assert ".progress-bar" in css
 
-    def test_generate_js(self, sample_pptx: Path) -> None:
+    def test_generate_js(self, converter: PowerPointToHTML5Converter) -> None:
         """Test JavaScript generation."""
-        converter = PowerPointToHTML5Converter(sample_pptx)
         js = converter._generate_js()
 
         assert isinstance(js, str)
@@ -192,38 +595,100 @@ class TestPowerPointToHTML5Converter:
         assert "addEventListener" in js
 
     def test_convert_creates_output_directory(
-        self, sample_pptx: Path, tmp_path: Path
+        self, converter: PowerPointToHTML5Converter, tmp_path: Path
     ) -> None:
         """Test that convert creates the output directory if it doesn't exist."""
         output_dir = tmp_path / "new_output"
         assert not output_dir.exists()
 
-        converter = PowerPointToHTML5Converter(sample_pptx)
         html_path = converter.convert(output_dir)
 
         assert output_dir.exists()
         assert html_path.exists()
 
-    def test_multiple_slides(self, tmp_path: Path, output_dir: Path) -> None:
+    def test_multiple_slides(self, multi_slide_pptx: Path, tmp_path: Path) -> None:
         """Test conversion with multiple slides."""
-        # Create a presentation with multiple slides
+        converter = PowerPointToHTML5Converter(multi_slide_pptx)
+        html_path = converter.convert(tmp_path)
+
+        html_content = html_path.read_text(encoding="utf-8")
+        # Check that all slides are present
+        assert set(_SLIDE_TITLE.findall(html_content)) == {"1", "2", "3", "4", "5"}
+
+    def test_extract_all_slides_parallel(self, tmp_path: Path) -> None:
+        """Test that slides extracted in worker processes match serial extraction."""
         prs = Presentation()
         for i in range(5):
-            slide_layout = prs.slide_layouts[0]
-            slide = prs.slides.add_slide(slide_layout)
-            title = slide.shapes.title
-            title.text = f"Slide {i + 1}"
+            slide = prs.slides.add_slide(prs.slide_layouts[1])
+            slide.shapes.title.text = f"Slide {i + 1}"
+            body = slide.placeholders[1].text_frame
+            body.text = "Sized text"
+            body.paragraphs[0].runs[0].font.size = Pt(18)
 
-        pptx_path = tmp_path / "multi_slide.pptx"
+        pptx_path = tmp_path / "parallel.pptx"
         prs.save(str(pptx_path))
 
         converter = PowerPointToHTML5Converter(pptx_path)
-        html_path = converter.convert(output_dir)
+        contents = converter._extract_all_slides(workers=2)
 
-        html_content = html_path.read_text(encoding="utf-8")
-        # Check that all slides are present
-        for i in range(5):
-            assert f"Slide {i + 1}" in html_content
+        assert contents == [
+            converter._extract_slide_content(slide)
+            for slide in converter.presentation.slides
+        ]
+        assert contents[0]["shapes"][1]["font_size"] == Pt(18)
+
+    def test_extract_all_slides_serial_by_default(
+        self, multi_slide_pptx: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that no worker processes are started unless asked for."""
+        pool = _FailingPool(AssertionError("worker pool started"))
+        monkeypatch.setattr(converter_module, "ProcessPoolExecutor", pool)
+        converter = PowerPointToHTML5Converter(multi_slide_pptx)
+
+        contents = converter._extract_all_slides()
+
+        assert [content["shapes"][0]["text"] for content in contents] == [
+            f"Slide {i + 1}" for i in range(5)
+        ]
+        assert not pool.created
+
+    @pytest.mark.parametrize(
+        "error",
+        [OSError("no /dev/shm"), AssertionError("daemonic processes"), None],
+        ids=["oserror", "daemonic", "broken"],
+    )
+    def test_extract_all_slides_pool_unavailable(
+        self,
+        multi_slide_pptx: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        error: Exception | None,
+    ) -> None:
+        """Test that slides are extracted in-process if the pool can't start."""
+        pool = _FailingPool(error or BrokenProcessPool("worker died"))
+        monkeypatch.setattr(converter_module, "ProcessPoolExecutor", pool)
+        converter = PowerPointToHTML5Converter(multi_slide_pptx)
+
+        contents = converter._extract_all_slides(workers=2)
+
+        assert [content["shapes"][0]["text"] for content in contents] == [
+            f"Slide {i + 1}" for i in range(5)
+        ]
+        assert pool.shut_down
+
+    def test_extract_all_slides_pool_breaks(
+        self, multi_slide_pptx: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that slides a broken pool didn't return are extracted in-process."""
+        converter = PowerPointToHTML5Converter(multi_slide_pptx)
+        pool = _FailingPool(BrokenProcessPool("worker died"), converter, returned=2)
+        monkeypatch.setattr(converter_module, "ProcessPoolExecutor", pool)
+
+        contents = converter._extract_all_slides(workers=2)
+
+        assert [content["shapes"][0]["text"] for content in contents] == [
+            f"Slide {i + 1}" for i in range(5)
+        ]
+        assert pool.shut_down
 
     def test_hidden_slide_detection(self, tmp_path: Path) -> None:
         """Test that slides marked hidden in the PPTX are detected."""
@@ -249,7 +714,7 @@ class TestPowerPointToHTML5Converter:
         prs.save(str(pptx_path))
 
         converter = PowerPointToHTML5Converter(pptx_path)
-        slides = list(converter.presentation.slides)
+        slides = converter.presentation.slides
         assert len(slides) >= 2
 
         content1 = converter._extract_slide_content(slides[0])
@@ -260,24 +725,20 @@ class TestPowerPointToHTML5Converter:
 
         # Ensure generated HTML contains the data-hidden marker for the hidden slide
         html = converter._generate_html([
-            {
-                "number": 1,
-                "title": content1["title"],
-                "shapes": content1["shapes"],
-                "notes": "",
-                "slide_width": content1["slide_width"],
-                "slide_height": content1["slide_height"],
-                "hidden": content1["hidden"],
-            },
-            {
-                "number": 2,
-                "title": content2["title"],
-                "shapes": content2["shapes"],
-                "notes": "",
-                "slide_width": content2["slide_width"],
-                "slide_height": content2["slide_height"],
-                "hidden": content2["hidden"],
-            },
+            SlideData(
+                number=1,
+                title=content1["title"],
+                shapes=content1["shapes"],
+                notes="",
+                hidden=content1["hidden"],
+            ),
+            SlideData(
+                number=2,
+                title=content2["title"],
+                shapes=content2["shapes"],
+                notes="",
+                hidden=content2["hidden"],
+            ),
         ], include_notes=False)
 
         assert 'data-hidden="true"' in html
@@ -310,8 +771,7 @@ class TestPowerPointToHTML5Converter:
         prs.save(str(pptx_path))
 
         converter = PowerPointToHTML5Converter(pptx_path)
-        slides = list(converter.presentation.slides)
-        content = converter._extract_slide_content(slides[0])
+        content = converter._extract_slide_content(converter.presentation.slides[0])
 
         # When timing is present, each extracted shape should have animation metadata
         assert "shapes" in content